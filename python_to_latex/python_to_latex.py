@@ -5,12 +5,12 @@
 This module gives several method to process data within python to use in latex.
 """
 
+import functools
+import io
+import pathlib
+
 import numpy as np
 import pandas as pd
-import matplotlib
-import matplotlib.pyplot as plt
-from matplotlib import colors
-from scipy import linalg as la
 
 
 def mat2lat(matrix,*, matrix_style="ownmatrix", save_name=None, style=dict()):
@@ -27,31 +27,48 @@ def mat2lat(matrix,*, matrix_style="ownmatrix", save_name=None, style=dict()):
     style (dict:{'decimal_points':0,'cell_width':3}): formating style for all numbers in the matrix. Currenlty, the formatting will be done using:
                :<cell_width>.<decimal_points>f
     """
-    s = f"\\begin{{{ matrix_style}}}\n"
-    decimal_points = f".{style.get('decimal_points',0)}f"
-    cell_width = str(style.get("cell_width", 3 + style.get("decimal_points", 0)))
-    for l in matrix:
-        s += " & ".join([f"{n:{cell_width}{decimal_points}}" for n in l])
-        s += "\\\\ \n"
-    s += f"\end{{{matrix_style}}}\n"
+    parts = [f"\\begin{{{ matrix_style}}}\n"]
+    decimal_points = style.get("decimal_points", 0)
+    cell_width = style.get("cell_width", 3 + decimal_points)
+    arr = np.atleast_2d(np.asanyarray(matrix))
+    if arr.size:
+        # format all cells in one vectorized pass instead of one f-string per element;
+        # atleast_2d turns a vector into a single row
+        cells = np.char.mod(f"%{cell_width}.{decimal_points}f", arr)
+        for row in cells:
+            parts.append(" & ".join(row))
+            parts.append("\\\\ \n")
+    parts.append(f"\end{{{matrix_style}}}\n")
+    s = "".join(parts)
 
     if save_name:
-        file_name = str(save_name)
-        if (
-            (file_name.endswith(".dat"))
-            or (file_name.endswith(".tab"))
-            or (file_name.endswith(".tex"))
-        ):
-            with open(file_name, "w") as f:
-                f.write(s)
-        else:
-            with open(file_name + ".tab", "w") as f:
-                f.write(s)
+        file_path = pathlib.Path(str(save_name))
+        if file_path.suffix not in (".dat", ".tab", ".tex"):
+            file_path = file_path.with_name(file_path.name + ".tab")
+        file_path.write_text(s, encoding="utf-8")
     else:
         print(s)
     return s
 
 
+def _format_numeric_rows(data):
+    """
+    Format the rows of a two dimensional array as a list of " & " joined cell strings.
+
+    Numeric input is formatted with %g in one vectorized NumPy pass; object or
+    ragged input falls back to per-cell str().
+    """
+    try:
+        arr = np.asarray(data)
+    except ValueError:
+        arr = None
+    if arr is not None and arr.ndim == 2 and arr.dtype.kind != "O":
+        fmt = "%g" if arr.dtype.kind in "iuf" else "%s"
+        cells = np.char.mod(fmt, arr)
+        return [" & ".join(row) for row in cells]
+    return [" & ".join([str(entry) for entry in row]) for row in data]
+
+
 def numeric_list_to_tabularx(
         data, *, heading=None, exponent=0, row_heading=None, save_name=None
 ):
@@ -84,69 +101,50 @@ def numeric_list_to_tabularx(
     """
     # Add input checking that data is 2D array like; row_heading is either None or a list; heading is either None or a list, exponent is int or None
 
-    s = "\\begin{tabularx}{\linewidth}{"
+    parts = ["\\begin{tabularx}{\linewidth}{"]
+    formatted_rows = _format_numeric_rows(data)
+    # the column specification is the same for every data column; build it once
+    if exponent is None:
+        column_spec = "S"
+    else:
+        column_spec = f"S[table-auto-round,table-omit-exponent,fixed-exponent={exponent}]"
     init = True
     if row_heading is not None:
-        for row, row_start in zip(data, row_heading):
+        for row, row_start, row_string in zip(data, row_heading, formatted_rows):
             if init:
-                s += "X"
-                if exponent:
-                    s += f"S" * len(row) + "} \\toprule"
-                else:
-                    s += (
-                        f"S[table-auto-round,table-omit-exponent,fixed-exponent={exponent}]"
-                        * len(row)
-                        + "} \\toprule"
-                    )
+                parts.append("X")
+                parts.append(column_spec * len(row) + "} \\toprule")
                 if heading:
-                    s += (
+                    parts.append(
                         "\n"
                         + " & "
                         + " & ".join(["{" + str(entry) + "}" for entry in heading])
                         + "\\\\ \midrule"
                     )
                 init = False
-            s += (
-                "\n"
-                + row_start
-                + " & "
-                + " & ".join([str(entry) for entry in row])
-                + "\\\\"
-            )
+            parts.append("\n" + row_start + " & " + row_string + "\\\\")
     else:
-        for row in data:
+        for row, row_string in zip(data, formatted_rows):
             if init:
-                if exponent:
-                    s += f"S" * len(row) + "} \\toprule"
-                else:
-                    s += (
-                        f"S[table-auto-round,table-omit-exponent,fixed-exponent={exponent}]"
-                        * len(row)
-                        + "} \\toprule"
-                    )
+                parts.append(column_spec * len(row) + "} \\toprule")
                 if heading:
-                    s += (
+                    parts.append(
                         "\n"
                         + " & ".join(["{" + str(entry) + "}" for entry in heading])
                         + "\\\\ \midrule"
                     )
                 init = False
-            s += "\n" + " & ".join([str(entry) for entry in row]) + "\\\\"
+            parts.append("\n" + row_string + "\\\\")
 
-        s += "\\bottomrule \n \end{tabularx}"
+    # close the environment once, for both branches
+    parts.append("\\bottomrule \n \end{tabularx}")
+    s = "".join(parts)
 
     if save_name:
-        file_name = str(save_name)
-        if (
-            (file_name.endswith(".dat"))
-            or (file_name.endswith(".tab"))
-            or (file_name.endswith(".tex"))
-        ):
-            with open(file_name, "w") as f:
-                f.write(s)
-        else:
-            with open(file_name + ".tab", "w") as f:
-                f.write(s)
+        file_path = pathlib.Path(str(save_name))
+        if file_path.suffix not in (".dat", ".tab", ".tex"):
+            file_path = file_path.with_name(file_path.name + ".tab")
+        file_path.write_text(s, encoding="utf-8")
     else:
         print(s)
     return s
@@ -167,6 +165,66 @@ plot_markers = {
     "s": "mark=square",
 }
 
+# precompiled axis option blocks; one format_map call per axis replaces
+# several f-string evaluations
+_axis_x_numeric_template = "    xlabel = {xlabel},\n    xmin={xmin}, xmax={xmax},\n"
+_axis_y_numeric_template = "    ylabel = {ylabel},\n    ymin={ymin}, ymax={ymax},\n"
+
+
+def _is_axis_spanning_line(xdata, ydata):
+    """
+    Detect the two point lines drawn by axhline/axvline.
+
+    Their data spans the axis in fractional coordinates; the emission loop
+    replaces it with the axis limits, so it must not contribute tick labels.
+    """
+    if len(xdata) == 2 and xdata[0] == 0 and xdata[1] == 1 and ydata[0] == ydata[1]:
+        return True
+    return len(ydata) == 2 and ydata[0] == 0 and ydata[1] == 1 and xdata[0] == xdata[1]
+
+
+def _first_seen_labels(arrays):
+    """
+    Return the unique string labels of the concatenated arrays in first-seen order.
+
+    Starts with "0" to match the dummy entry pgfplots needs for symbolic axes.
+    """
+    if not arrays:
+        return [str(0)]
+    labels = np.concatenate([arr.astype(str) for arr in arrays])
+    _, first_index = np.unique(labels, return_index=True)
+    return [str(0)] + [label for label in labels[np.sort(first_index)] if label != str(0)]
+
+
+@functools.lru_cache(maxsize=16)
+def _make_line_style_emitter(retain_color, retain_linestyle, retain_marker):
+    """
+    Build a formatter for the \addplot option block specialized on the retain_* flags.
+
+    The returned closure contains only the style emitters that are switched
+    on, so the per-line loop does not re-test the flags.
+    """
+    emitters = []
+    if retain_linestyle:
+        def _linestyle(style, marker, color_name):
+            linestyle = plot_linestyles.get(style, None)
+            return f"{linestyle}," if linestyle else ""
+        emitters.append(_linestyle)
+    if retain_color:
+        def _color(style, marker, color_name):
+            return f"{color_name},"
+        emitters.append(_color)
+    if retain_marker:
+        def _marker(style, marker, color_name):
+            markers = plot_markers.get(marker, None)
+            return f"{markers}," if markers else ""
+        emitters.append(_marker)
+
+    def emit(style, marker, color_name=None):
+        return "".join(emitter(style, marker, color_name) for emitter in emitters)
+
+    return emit
+
 
 def fig2pgf(
     fig,
@@ -249,6 +307,10 @@ def fig2pgf(
      }
 
     """
+    # import lazily so users of the table functions do not pay the
+    # matplotlib start-up cost
+    from matplotlib import colors
+
     # implement input checking:
     # check whether fig is a figure todo
     # check plot/line_options are dictionaries
@@ -271,7 +333,9 @@ def fig2pgf(
         s_start = ""
         s_exit = "\end{axis}\n"
     else:
-        row_number, column_number, index = ax[0].get_geometry()
+        # get_geometry() is deprecated/removed in recent matplotlib; read the grid shape directly
+        gridspec = ax[0].get_subplotspec().get_gridspec()
+        row_number, column_number = gridspec.nrows, gridspec.ncols
         s_init = (
             "\\begin{groupplot}[group style={group size="
             + str(column_number)
@@ -286,11 +350,16 @@ def fig2pgf(
         s_start = "\\nextgroupplot[\n"
 
     # start string that makes figure
-    s = "%This file was created by python_to_latex. \n\\begin{tikzpicture} \n"
+    parts = ["%This file was created by python_to_latex. \n\\begin{tikzpicture} \n"]
     if retain_color:
         color_definitions = list()
-        s += " REPLACE_COLORS \n"
-    s += s_init
+        color_names = dict()
+        parts.append(" REPLACE_COLORS \n")
+    parts.append(s_init)
+
+    line_style_emitter = _make_line_style_emitter(
+        bool(retain_color), bool(retain_linestyle), bool(retain_marker)
+    )
 
     s_legend = list()
     # add each subplot
@@ -298,45 +367,78 @@ def fig2pgf(
 
         ## axis definition:
 
-        s += s_start
+        parts.append(s_start)
         # todo logarithmic scale for x or y using tikz options below
         # "xmode=log|normal,ymode=log|normal"
 
+        # gather all line properties up front (structure of arrays); every
+        # get_* call goes through matplotlib's artist property machinery
+        lines_soa = {
+            key: [getattr(l, "get_" + key)() for l in axis.lines]
+            for key in ("linestyle", "color", "marker", "label")
+        }
+        lines_soa["xdata"] = [np.array(l.get_xdata()) for l in axis.lines]
+        lines_soa["ydata"] = [np.array(l.get_ydata()) for l in axis.lines]
+
         # set label, min, max and check whethere the ticks are symbolic for x and y axis
-        s += f"    xlabel = {axis.get_xlabel()},\n"
-        if True in [np.array(i.get_xdata()).dtype.kind in ['S','U'] for i in axis.lines]:
-            symbolic_x_coordinates = [str(0)]
+        if any(xd.dtype.kind in ['S','U'] for xd in lines_soa["xdata"]):
+            parts.append(f"    xlabel = {axis.get_xlabel()},\n")
+            # collect the symbolic tick labels of all lines in one vectorized pass
+            symbolic_x_coordinates = _first_seen_labels(
+                [
+                    xd
+                    for xd, yd in zip(lines_soa["xdata"], lines_soa["ydata"])
+                    if not _is_axis_spanning_line(xd, yd)
+                ]
+            )
             date_x_coordinates = False
-            s += "    xtick = data,\n    symbolic x coords = {REPLACE_SYMBOLIC_COORDS_X},\n"
+            parts.append("    xtick = data,\n    symbolic x coords = {REPLACE_SYMBOLIC_COORDS_X},\n")
             plot_as_table = False
-        elif True in [np.array(i.get_xdata()).dtype.kind in ['M'] for i in axis.lines]:
+        elif any(xd.dtype.kind in ['M'] for xd in lines_soa["xdata"]):
+            parts.append(f"    xlabel = {axis.get_xlabel()},\n")
             symbolic_x_coordinates = None
             date_x_coordinates = True
-            s += "    date coordinates in = x,\n    xticklabel=\day.\month.\year\ \hour:\minute \second,\n    xticklabel style={rotate=45,anchor=east,},\n"
-            min_x = min([min(i) for i in [i.get_xdata() for i in axis.lines if np.array(i.get_xdata()).dtype.kind in ['M']]])
-            max_x = max([max(i) for i in [i.get_xdata() for i in axis.lines if np.array(i.get_xdata()).dtype.kind in ['M']]])
+            parts.append("    date coordinates in = x,\n    xticklabel=\day.\month.\year\ \hour:\minute \second,\n    xticklabel style={rotate=45,anchor=east,},\n")
+            min_x = min([min(xd) for xd in lines_soa["xdata"] if xd.dtype.kind in ['M']])
+            max_x = max([max(xd) for xd in lines_soa["xdata"] if xd.dtype.kind in ['M']])
 
-            s += f"    xmin={pd.to_datetime(min_x).strftime(date_format)}, xmax={pd.to_datetime(max_x).strftime(date_format)},\n"
+            parts.append(f"    xmin={pd.to_datetime(min_x).strftime(date_format)}, xmax={pd.to_datetime(max_x).strftime(date_format)},\n")
         else:
             symbolic_x_coordinates = None
             date_x_coordinates = False
-            s += f"    xmin={axis.get_xlim()[0]}, xmax={axis.get_xlim()[1]},\n"
+            xmin, xmax = axis.get_xlim()
+            parts.append(
+                _axis_x_numeric_template.format_map(
+                    {"xlabel": axis.get_xlabel(), "xmin": xmin, "xmax": xmax}
+                )
+            )
 
-        s += f"    ylabel = {axis.get_ylabel()},\n"
-        if True in [np.array(i.get_ydata()).dtype.num in [19] for i in axis.lines]:
-            symbolic_y_coordinates = [str(0)]
-            s += "    ytick = data,\n    symbolic y coords = {REPLACE_SYMBOLIC_COORDS_Y},\n"
+        if any(yd.dtype.num == 19 for yd in lines_soa["ydata"]):
+            parts.append(f"    ylabel = {axis.get_ylabel()},\n")
+            symbolic_y_coordinates = _first_seen_labels(
+                [
+                    yd
+                    for xd, yd in zip(lines_soa["xdata"], lines_soa["ydata"])
+                    if not _is_axis_spanning_line(xd, yd)
+                ]
+            )
+            parts.append("    ytick = data,\n    symbolic y coords = {REPLACE_SYMBOLIC_COORDS_Y},\n")
             plot_as_table = False
         else:
             symbolic_y_coordinates = None
-            s += f"    ymin={axis.get_ylim()[0]}, ymax={axis.get_ylim()[1]},\n"
+            ymin, ymax = axis.get_ylim()
+            parts.append(
+                _axis_y_numeric_template.format_map(
+                    {"ylabel": axis.get_ylabel(), "ymin": ymin, "ymax": ymax}
+                )
+            )
         # todo add other options from figure
         # add user options if available
         if plot_options:
             option = plot_options.get(axis.get_label(), None)
             if option:
-                s += "    " + str(option) + "\n"
-        s += "    ]\n"
+                parts.append("    " + str(option) + "\n")
+        parts.append("    ]\n")
 
         # add a legend file
         if export_legend:
@@ -361,147 +463,139 @@ def fig2pgf(
             legend_labels = [i.get_text() for i in axis.get_legend().texts]
             if export_legend:
                 s_legend[-1] += "\legend{" + ",".join(legend_labels) + "}\n"
-                s += "%\legend{" + ",".join(legend_labels) + "}\n"
+                parts.append("%\legend{" + ",".join(legend_labels) + "}\n")
             else:
-                s += "\legend{" + ",".join(legend_labels) + "}\n"
+                parts.append("\legend{" + ",".join(legend_labels) + "}\n")
 
         # add line plots.
-        for line_number, line in enumerate(axis.lines):
+        for line_number in range(len(axis.lines)):
+            xdata = lines_soa["xdata"][line_number]
+            ydata = lines_soa["ydata"][line_number]
 
-            s += "\\addplot +["
+            parts.append("\\addplot +[")
             # add necessary options
-            if retain_linestyle:
-                linestyle = plot_linestyles.get(line.get_linestyle(), None)
-                if linestyle:
-                    s += f"{linestyle},"
             if retain_color:
-                color_hex = line.get_color()
-                if not color_hex.startswith("#"):
-                    color_hex = colors.to_hex(color_hex)
-                color_definitions.append(
-                    "\definecolor{color"
-                    + str(len(color_definitions))
-                    + "}{RGB}{"
-                    + " , ".join(
-                        [
-                            str(int(color_hex.lstrip("#")[i : i + 2], 16))
-                            for i in (0, 2, 4)
-                        ]
+                # to_rgb handles hex strings, named colors and rgb tuples alike
+                rgb = colors.to_rgb(lines_soa["color"][line_number])
+                color_name = color_names.get(rgb)
+                if color_name is None:
+                    # define each unique color only once
+                    color_name = f"color{len(color_names)}"
+                    color_names[rgb] = color_name
+                    red, green, blue = (int(round(255 * c)) for c in rgb)
+                    color_definitions.append(
+                        f"\definecolor{{{color_name}}}{{RGB}}{{{red} , {green} , {blue}}} "
                     )
-                    + "} "
+            else:
+                color_name = None
+            parts.append(
+                line_style_emitter(
+                    lines_soa["linestyle"][line_number],
+                    lines_soa["marker"][line_number],
+                    color_name,
                 )
-                s += f"color{str(len(color_definitions)-1)},"
-            if retain_marker:
-                markers = plot_markers.get(line.get_marker(), None)
-                if markers:
-                    s += f"{markers},"
+            )
             # add additional user options
             if line_options:
-                s += str(line_options.get(line.get_label(), ""))
-            s += "]\n"
+                parts.append(str(line_options.get(lines_soa["label"][line_number], "")))
+            parts.append("]\n")
 
             if (
-                len(line.get_xdata()) == 2
-                and line.get_xdata()[0] == 0
-                and line.get_xdata()[1] == 1
-                and line.get_ydata()[0] == line.get_ydata()[1]
+                len(xdata) == 2
+                and xdata[0] == 0
+                and xdata[1] == 1
+                and ydata[0] == ydata[1]
             ):
                 # This is a horizontal line
-                s += (
+                parts.append(
                     "coordinates{"
-                    + f"({axis.get_xlim()[0]},{line.get_ydata()[0]}) \n ({axis.get_xlim()[1]},{line.get_ydata()[1]})"
+                    + f"({axis.get_xlim()[0]},{ydata[0]}) \n ({axis.get_xlim()[1]},{ydata[1]})"
                     + "};\n"
                 )
             elif (
-                len(line.get_ydata()) == 2
-                and line.get_ydata()[0] == 0
-                and line.get_ydata()[1] == 1
-                and line.get_xdata()[0] == line.get_xdata()[1]
+                len(ydata) == 2
+                and ydata[0] == 0
+                and ydata[1] == 1
+                and xdata[0] == xdata[1]
             ):
                 # This is a vertical line
-                s += (
+                parts.append(
                     "coordinates{"
-                    + f"({line.get_xdata()[0]},{axis.get_ylim()[0]}) \n ({line.get_xdata()[1]},{axis.get_ylim()[1]})"
+                    + f"({xdata[0]},{axis.get_ylim()[0]}) \n ({xdata[1]},{axis.get_ylim()[1]})"
                     + "};\n"
                 )
             else:
                 # This is any other line
                 if plot_as_table:
                     if date_x_coordinates:
-                        s += (
+                        parts.append(
                             " table{%\n"
                             + "\n".join(
                                 [
                                     f"  {pd.to_datetime(x).strftime(date_format)} {y}"
-                                    for (x, y) in zip(line.get_xdata(), line.get_ydata())
+                                    for (x, y) in zip(xdata, ydata)
                                 ]
                             )
                             + "\n};\n"
                         )
                     else:
-                        s += (
-                            " table{%\n"
-                            + "\n".join(
-                                [
-                                    f"  {x} {y}"
-                                    for (x, y) in zip(line.get_xdata(), line.get_ydata())
-                                ]
+                        if xdata.dtype.kind in "iuf" and ydata.dtype.kind in "iuf":
+                            # format all points in one C-level pass instead of one f-string per point
+                            xy = np.column_stack([xdata, ydata])
+                            buffer = io.StringIO()
+                            np.savetxt(buffer, xy, fmt="  %g %g")
+                            parts.append(" table{%\n" + buffer.getvalue() + "};\n")
+                        else:
+                            # e.g. datetime objects; these cannot go through the numeric formatter
+                            parts.append(
+                                " table{%\n"
+                                + "\n".join(
+                                    [f"  {x} {y}" for (x, y) in zip(xdata, ydata)]
+                                )
+                                + "\n};\n"
                             )
-                            + "\n};\n"
-                        )
                 else:
-                    if symbolic_x_coordinates:
-                        [
-                            symbolic_x_coordinates.append(str(label))
-                            for label in line.get_xdata()
-                            if label not in symbolic_x_coordinates
-                        ]
-                    if symbolic_y_coordinates:
-                        [
-                            symbolic_y_coordinates.append(str(label))
-                            for label in line.get_ydata()
-                            if label not in symbolic_y_coordinates
-                        ]
                     if date_x_coordinates:
-                        s += (
+                        parts.append(
                             " coordinates{%\n"
                             + "\n".join(
                                 [
                                     f"  ({pd.to_datetime(x).strftime(date_format)},{y})"
-                                    for (x, y) in zip(line.get_xdata(), line.get_ydata())
+                                    for (x, y) in zip(xdata, ydata)
                                 ]
                             )
                             + "\n};\n"
                         )
                     else:
-                        s += (
-                            " coordinates{%\n"
-                            + "\n".join(
-                                [
-                                    f"  ({x},{y})"
-                                    for (x, y) in zip(line.get_xdata(), line.get_ydata())
-                                ]
+                        if xdata.dtype.kind in "iuf" and ydata.dtype.kind in "iuf":
+                            buffer = io.StringIO()
+                            np.savetxt(buffer, np.column_stack([xdata, ydata]), fmt="  (%g,%g)")
+                            parts.append(" coordinates{%\n" + buffer.getvalue() + "};\n")
+                        else:
+                            # symbolic coordinates cannot go through the numeric formatter
+                            parts.append(
+                                " coordinates{%\n"
+                                + "\n".join(
+                                    [
+                                        f"  ({x},{y})"
+                                        for (x, y) in zip(xdata, ydata)
+                                    ]
+                                )
+                                + "\n};\n"
                             )
-                            + "\n};\n"
-                        )
 
             if add_labels:
-                s += f"\label{{pgfplot:{add_labels}{line_number}}}"
+                parts.append(f"\label{{pgfplot:{add_labels}{line_number}}}")
 
             if export_legend:
                 s_legend[-1] += "\\addplot +["
-                if retain_linestyle:
-                    linestyle = plot_linestyles.get(line.get_linestyle(), None)
-                    if linestyle:
-                        s_legend[-1] += f"{linestyle},"
-                if retain_color:
-                    s_legend[-1] += f"color{str(len(color_definitions)-1)},"
-                if retain_marker:
-                    markers = plot_markers.get(line.get_marker(), None)
-                    if markers:
-                        s_legend[-1] += f"{markers},"
+                s_legend[-1] += line_style_emitter(
+                    lines_soa["linestyle"][line_number],
+                    lines_soa["marker"][line_number],
+                    color_name,
+                )
                 if line_options:
-                    s_legend[-1] += str(line_options.get(line.get_label(), ""))
+                    s_legend[-1] += str(line_options.get(lines_soa["label"][line_number], ""))
                 s_legend[-1] += "]"
                 s_legend[-1] += "coordinates {(0,0)};\n"
 
@@ -517,37 +611,31 @@ def fig2pgf(
             s_legend[-1] += "\end{axis}\n\end{tikzpicture} \n"
 
     if retain_color:
-        s = s.replace("REPLACE_COLORS", "\n ".join(color_definitions)) + "\n"
+        parts.append("\n")
+
+    # finish string
+    parts.append(s_exit + "\end{tikzpicture} \n")
+    s = "".join(parts)
+
+    if retain_color:
+        s = s.replace("REPLACE_COLORS", "\n ".join(color_definitions))
 
     if symbolic_x_coordinates:
         s = s.replace("REPLACE_SYMBOLIC_COORDS_X", ",".join(symbolic_x_coordinates))
     if symbolic_y_coordinates:
         s = s.replace("REPLACE_SYMBOLIC_COORDS_Y", ",".join(symbolic_y_coordinates))
 
-    # finish string
-    s += s_exit + "\end{tikzpicture} \n"
-
     if save_name:
-        file_name = str(save_name)
-        if (
-            (file_name.endswith(".tikz"))
-            or (file_name.endswith(".pgf"))
-            or (file_name.endswith(".tex"))
-        ):
-            with open(file_name, "w") as f:
-                if export_legend:
-                    for idx, legend_string in enumerate(s_legend):
-                        f_name = file_name.replace(".", "_legend" + str(idx) + ".")
-                        with open(f_name,"w") as f_legend:
-                            f_legend.write(legend_string)
-                f.write(s)
-        else:
-            with open(file_name + ".tikz", "w") as f:
-                if export_legend:
-                    for idx, legend_string in enumerate(s_legend):
-                        with open(file_name + "_legend" + str(idx) + ".tikz", "w") as f_legend:
-                            f_legend.write(legend_string)
-                f.write(s)
+        file_path = pathlib.Path(str(save_name))
+        if file_path.suffix not in (".tikz", ".pgf", ".tex"):
+            file_path = file_path.with_name(file_path.name + ".tikz")
+        if export_legend:
+            for idx, legend_string in enumerate(s_legend):
+                legend_path = file_path.with_name(
+                    file_path.stem + "_legend" + str(idx) + file_path.suffix
+                )
+                legend_path.write_text(legend_string, encoding="utf-8")
+        file_path.write_text(s, encoding="utf-8")
     else:
         print(s)
 
@@ -621,20 +709,22 @@ def pgf2plotdata(file_name,ext='tikz'):
                     number = value.lstrip("(").rstrip(")")
                     if number.endswith("+0j"):
                         number = number[:-3]
-                    if "." in number:
-                        curve[idx].append(float(number))
-                    else:
+                    # fig2pgf writes %g, so large magnitudes come as e-notation
+                    try:
                         curve[idx].append(int(number))
+                    except ValueError:
+                        curve[idx].append(float(number))
 
             elif line[0].startswith("("):
                 for idx,value in enumerate(line.lstrip("(").rstrip(")").split(',')):
                     if len(curve)<idx+1:
                         curve.append(list())
                     number = value.lstrip("(").rstrip(")").rstrip("+0j")
-                    if "." in number:
-                        curve[idx].append(float(number))
-                    else:
+                    # fig2pgf writes %g, so large magnitudes come as e-notation
+                    try:
                         curve[idx].append(int(number))
+                    except ValueError:
+                        curve[idx].append(float(number))
 
         plot.append(curve)
         plots.append(plot)
@@ -6,19 +6,23 @@ here = pathlib.Path(__file__).parent.resolve()
 # Get the long description from the README file
 long_description = (here / "README.md").read_text(encoding="utf-8")
 
-
-import python_to_latex as p2l
-
+# Read the package metadata without importing the package, so the build
+# does not pull in the scientific dependencies.
+metadata = {}
+init_source = (here / "python_to_latex" / "__init__.py").read_text(encoding="utf-8")
+exec(
+    "\n".join(line for line in init_source.splitlines() if line.startswith("__")),
+    metadata,
+)
 
 setup(
     name="python_to_latex",
-    version=p2l.__version__,
+    version=metadata["__version__"],
     description="Python module to facilitate input in LaTex from Python scripts",
-    long_description=open("README.md").read(),
-    long_description_content_type="text/markdown",
     long_description=long_description,
-    author=p2l.__authors__,
-    author_email=p2l.__author_emails__,
+    long_description_content_type="text/markdown",
+    author=metadata["__authors__"],
+    author_email=metadata["__author_emails__"],
     url="https://github.com/scythja123/TODO",
     license="GPLv3",
     packages=find_packages(where=here),